@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import logging
 
-from aiohttp import ClientSession
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import slugify
+from homeassistant.util.ssl import get_default_context
 
 from .api import MolnusApiClient
 from .const import (
@@ -24,14 +27,82 @@ from .const import (
     DEFAULT_WILDLIFE_REQUIRED,
     DEFAULT_LIMIT,
     DEFAULT_SCAN_INTERVAL,
+    API_TIMEOUT,
+    API_CONNECT_TIMEOUT,
+    API_LIMIT_PER_HOST,
+    IMAGE_TIMEOUT,
+    IMAGE_CONNECT_TIMEOUT,
+    IMAGE_LIMIT_PER_HOST,
+    KEEPALIVE_TIMEOUT,
+    DNS_CACHE_TTL,
+    DATA_SESSIONS,
 )
 from .coordinator import MolnusCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+def _create_session(
+    limit_per_host: int,
+    total_timeout: int,
+    connect_timeout: int,
+) -> ClientSession:
+    """Create a dedicated session with a tuned connector for Molnus."""
+    connector = TCPConnector(
+        ssl=get_default_context(),
+        limit_per_host=limit_per_host,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL,
+    )
+
+    return ClientSession(
+        connector=connector,
+        timeout=ClientTimeout(
+            total=total_timeout,
+            connect=connect_timeout,
+        ),
+    )
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    # One session pair shared by all cameras so per-host limits and the
+    # DNS cache apply to the whole integration. Separate pools: metadata
+    # polls never queue behind image downloads.
+    session = _create_session(
+        API_LIMIT_PER_HOST,
+        API_TIMEOUT,
+        API_CONNECT_TIMEOUT,
+    )
+    image_session = _create_session(
+        IMAGE_LIMIT_PER_HOST,
+        IMAGE_TIMEOUT,
+        IMAGE_CONNECT_TIMEOUT,
+    )
+
+    hass.data[DATA_SESSIONS] = {
+        "api": session,
+        "image": image_session,
+    }
+
+    async def _async_close_sessions(_event: Event) -> None:
+        await session.close()
+        await image_session.close()
+
+    hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE,
+        _async_close_sessions,
+    )
+
+    async_setup_services(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    session: ClientSession = async_get_clientsession(hass)
+    sessions = hass.data[DATA_SESSIONS]
 
     email = entry.data[CONF_EMAIL]
     password = entry.data[CONF_PASSWORD]
@@ -51,10 +122,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     client = MolnusApiClient(
-        session=session,
+        session=sessions["api"],
         base_url=BASE_URL,
         email=email,
         password=password,
+        image_session=sessions["image"],
     )
 
     coordinator = MolnusCoordinator(
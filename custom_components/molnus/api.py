@@ -4,10 +4,21 @@ from dataclasses import dataclass
 from typing import Any
 
 import asyncio
+import json
 import time
 
 from aiohttp import ClientSession
 
+from .const import IMAGE_FIELDS
+
+try:
+    # Bundled with Home Assistant, but keep the stdlib fallback just in case
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
+
 
 @dataclass
 class MolnusTokens:
@@ -23,9 +34,14 @@ class MolnusApiClient:
         base_url: str,
         email: str,
         password: str,
+        image_session: ClientSession | None = None,
     ) -> None:
         self._session = session
 
+        # Image downloads get their own connection pool so they never
+        # hold up /images polls
+        self._image_session = image_session or session
+
         # Force current Molnus API host
         self._base_url = "https://client-api.molnus.com"
 
@@ -116,12 +132,24 @@ class MolnusApiClient:
 
                 async with self._session.get(url, headers=headers) as resp2:
                     resp2.raise_for_status()
-                    data = await resp2.json()
+                    raw = await resp2.read()
             else:
                 resp.raise_for_status()
-                data = await resp.json()
+                raw = await resp.read()
+
+        data = _json_loads(raw) if raw else None
+
+        # The limit query param caps the page server-side; slicing again here
+        # only guards against oversized pages before the trimmed copies
+        return [
+            self._trim_image(image)
+            for image in self._extract_images(data, limit)
+            if isinstance(image, dict)
+        ]
 
-        return self._extract_images(data, limit)
+    @staticmethod
+    def _trim_image(image: dict[str, Any]) -> dict[str, Any]:
+        return {key: image[key] for key in IMAGE_FIELDS if key in image}
 
     def _extract_images(
         self,
@@ -148,6 +176,6 @@ class MolnusApiClient:
         )
 
     async def fetch_bytes(self, url: str) -> bytes:
-        async with self._session.get(url) as resp:
+        async with self._image_session.get(url) as resp:
             resp.raise_for_status()
             return await resp.read()
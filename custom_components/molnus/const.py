@@ -14,4 +14,41 @@ DEFAULT_SCAN_INTERVAL = 60  # seconds
 
 BASE_URL = "https://molnus.com"
 
+# Image keys exposed as sensor attributes
+IMAGE_ATTRIBUTES = (
+    "url",
+    "thumbnailUrl",
+    "captureDate",
+    "createdAt",
+    "updatedAt",
+    "deviceFilename",
+    "CameraId",
+)
+
+# Image fields kept by the API client; everything else is dropped
+IMAGE_FIELDS = (
+    "id",
+    *IMAGE_ATTRIBUTES,
+    "imagePredictions",
+    "ImagePredictions",
+)
+
+# HTTP tuning (seconds unless noted)
+API_TIMEOUT = 30
+API_CONNECT_TIMEOUT = 10
+IMAGE_TIMEOUT = 120
+IMAGE_CONNECT_TIMEOUT = 15
+API_LIMIT_PER_HOST = 4  # connections
+IMAGE_LIMIT_PER_HOST = 2  # connections
+KEEPALIVE_TIMEOUT = 120  # keep above DEFAULT_SCAN_INTERVAL
+DNS_CACHE_TTL = 300
+
+# Domain-wide HTTP sessions, kept out of the entry_id-keyed hass.data[DOMAIN]
+DATA_SESSIONS = f"{DOMAIN}_sessions"
+
+# molnus.refresh service
+SERVICE_REFRESH = "refresh"
+ATTR_ACCOUNT = "account"
+REFRESH_DEBOUNCE = 5  # seconds
+
 PLATFORMS = ["sensor", "camera"]
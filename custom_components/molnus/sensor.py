@@ -8,7 +8,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, CONF_CAMERA_ID
+from .const import DOMAIN, CONF_CAMERA_ID, IMAGE_ATTRIBUTES
 from .coordinator import MolnusCoordinator
 
 
@@ -130,15 +130,7 @@ class MolnusLatestImageIdSensor(
 
         attrs: dict[str, Any] = {}
 
-        for key in [
-            "url",
-            "thumbnailUrl",
-            "captureDate",
-            "createdAt",
-            "updatedAt",
-            "deviceFilename",
-            "CameraId",
-        ]:
+        for key in IMAGE_ATTRIBUTES:
             if key in latest:
                 attrs[key] = latest.get(key)
 
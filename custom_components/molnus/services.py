@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    ENTITY_MATCH_ALL,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    callback,
+)
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
+
+from .const import (
+    DOMAIN,
+    CONF_EMAIL,
+    CONF_CAMERA_ID,
+    SERVICE_REFRESH,
+    ATTR_ACCOUNT,
+    REFRESH_DEBOUNCE,
+)
+from .coordinator import MolnusCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Target is optional here: camera_id/account, or nothing at all, is valid
+REFRESH_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional(CONF_CAMERA_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_ACCOUNT): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+def _resolve_entry_ids(hass: HomeAssistant, call: ServiceCall) -> set[str]:
+    """Map the service call targets to loaded Molnus config entry ids."""
+    loaded: dict[str, Any] = hass.data.get(DOMAIN, {})
+
+    has_target = any(key in call.data for key in cv.TARGET_SERVICE_FIELDS)
+    camera_ids = {str(c).strip() for c in call.data.get(CONF_CAMERA_ID) or []}
+    accounts = {str(a).strip().lower() for a in call.data.get(ATTR_ACCOUNT) or []}
+
+    # No target => refresh everything
+    if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL or not (
+        has_target or camera_ids or accounts
+    ):
+        return set(loaded)
+
+    entry_ids: set[str] = set()
+
+    if has_target:
+        selected = async_extract_referenced_entity_ids(hass, call)
+        ent_reg = er.async_get(hass)
+
+        for entity_id in selected.referenced | selected.indirectly_referenced:
+            reg_entry = ent_reg.async_get(entity_id)
+            if reg_entry is None or reg_entry.platform != DOMAIN:
+                continue
+            if reg_entry.config_entry_id in loaded:
+                entry_ids.add(reg_entry.config_entry_id)
+
+    for entry_id in loaded:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry is None:
+            continue
+
+        if str(entry.data.get(CONF_CAMERA_ID, "")).strip() in camera_ids:
+            entry_ids.add(entry_id)
+
+        if str(entry.data.get(CONF_EMAIL, "")).strip().lower() in accounts:
+            entry_ids.add(entry_id)
+
+    return entry_ids
+
+
+class _RefreshScheduler:
+    """Collect refresh requests and run them as one batch after a delay.
+
+    The timer is rearmed whenever entries are pending and no batch is
+    running, so requests made during a batch are picked up right after it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._pending: set[str] = set()
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._running = False
+        self._shutdown = False
+        self._job = HassJob(self._handle_timer, cancel_on_shutdown=True)
+
+    @callback
+    def async_request(self, entry_ids: set[str]) -> None:
+        self._pending.update(entry_ids)
+        self._async_schedule()
+
+    @callback
+    def async_shutdown(self) -> None:
+        self._shutdown = True
+        self._pending.clear()
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+
+    @callback
+    def _async_schedule(self) -> None:
+        if (
+            self._shutdown
+            or self._running
+            or self._cancel_timer is not None
+            or not self._pending
+        ):
+            return
+
+        self._cancel_timer = async_call_later(
+            self._hass,
+            REFRESH_DEBOUNCE,
+            self._job,
+        )
+
+    @callback
+    def _handle_timer(self, _now: Any) -> None:
+        self._cancel_timer = None
+        self._running = True
+        self._hass.async_create_task(self._async_run())
+
+    async def _async_run(self) -> None:
+        try:
+            entry_ids = set(self._pending)
+            self._pending.clear()
+
+            loaded: dict[str, Any] = self._hass.data.get(DOMAIN, {})
+            coordinators: list[MolnusCoordinator] = [
+                loaded[entry_id]["coordinator"]
+                for entry_id in entry_ids
+                if entry_id in loaded
+            ]
+
+            _LOGGER.debug("Molnus refresh: %s camera(s)", len(coordinators))
+
+            await asyncio.gather(
+                *(coordinator.async_refresh() for coordinator in coordinators)
+            )
+        finally:
+            self._running = False
+            # Requests that arrived during this batch
+            self._async_schedule()
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the coalescing molnus.refresh service."""
+    scheduler = _RefreshScheduler(hass)
+
+    async def _async_handle_refresh(call: ServiceCall) -> None:
+        entry_ids = _resolve_entry_ids(hass, call)
+        if not entry_ids:
+            _LOGGER.warning("Molnus refresh matched no configured cameras")
+            return
+
+        scheduler.async_request(entry_ids)
+
+    @callback
+    def _async_shutdown(_event: Event) -> None:
+        scheduler.async_shutdown()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_shutdown)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        _async_handle_refresh,
+        schema=REFRESH_SCHEMA,
+    )